@@ -8,23 +8,28 @@ INSTALLATION REQUIREMENTS (for real hardware):
 3. Connect your USB PC/SC reader
 4. Run: python server.py
 
+Optional (Linux/macOS): pip install uvloop httptools for a faster event loop and HTTP parser.
+
 This server supports both simulated mode (web preview) and real hardware mode.
 """
 
 from fastapi import FastAPI, APIRouter, HTTPException, Query
-from fastapi.responses import StreamingResponse, Response
+from fastapi.responses import StreamingResponse, Response, ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient, ReturnDocument
+from pymongo.write_concern import WriteConcern
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional
 import uuid
+import asyncio
+import threading
+import time
 from datetime import datetime, timezone
-import json
-import csv
+import orjson
 import io
 import base64
 
@@ -45,6 +50,7 @@ except ImportError:
 QR_MODE = False
 try:
     import qrcode
+    from qrcode.image.svg import SvgPathImage
     from PIL import Image
     QR_MODE = True
     print("✓ qrcode loaded - Real QR code generation available")
@@ -55,11 +61,24 @@ ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
+# Timestamps are stored as native BSON dates; tz_aware keeps them UTC-aware on read
 mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
-client = AsyncIOMotorClient(mongo_url)
+# zstd (falling back to zlib) compresses list and export traffic; the driver
+# already sets TCP keepalive and retryable writes by default
+client = AsyncMongoClient(
+    mongo_url,
+    tz_aware=True,
+    minPoolSize=20,
+    maxPoolSize=200,
+    compressors="zstd,zlib"
+)
 db = client[os.environ.get('DB_NAME', 'simguard_db')]
+# Activity logs are advisory: unacknowledged writes (w=0) return as soon as the
+# driver hands them off, at the cost of silently losing entries the server rejects
+# or never receives
+activity_logs = db.activity_logs.with_options(write_concern=WriteConcern(w=0))
 
-app = FastAPI(title="SimGuard Pro API - Standalone Edition")
+app = FastAPI(title="SimGuard Pro API - Standalone Edition", default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 
 # Configure logging
@@ -106,6 +125,16 @@ class CardInfo(BaseModel):
     is_real: bool = False
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+class CardSummary(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str
+    iccid: str
+    imsi: str
+    spn: str
+    card_type: str = "nano"
+    is_real: bool = False
+    timestamp: datetime
+
 class Contact(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -154,6 +183,7 @@ class EsimProfile(BaseModel):
     activation_code: str
     qr_data: str
     qr_image_base64: Optional[str] = None
+    qr_image_svg: Optional[str] = None
     profile_name: str
     carrier: str
     status: str = "pending"
@@ -167,6 +197,16 @@ class ContactCreate(BaseModel):
     group: Optional[str] = None
     email: Optional[str] = None
 
+class ContactEntry(BaseModel):
+    name: str
+    number: str
+    group: Optional[str] = None
+    email: Optional[str] = None
+
+class ContactBulkCreate(BaseModel):
+    card_id: str
+    contacts: List[ContactEntry]
+
 class ContactUpdate(BaseModel):
     name: Optional[str] = None
     number: Optional[str] = None
@@ -198,49 +238,124 @@ class ImportData(BaseModel):
 
 # ============== HARDWARE HELPER FUNCTIONS ==============
 
-def get_real_readers():
-    """Get list of actual connected PC/SC readers"""
+class CardConnectionPool:
+    """Keeps one open PC/SC connection per reader, shared by status probes and card reads"""
+
+    def __init__(self):
+        self._connections = {}
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def _lock_for(self, name):
+        with self._guard:
+            return self._locks.setdefault(name, threading.Lock())
+
+    def _discard(self, name):
+        connection = self._connections.pop(name, None)
+        if connection is not None:
+            try:
+                connection.disconnect()
+            except Exception:
+                pass
+
+    def run(self, reader, operation):
+        """Run operation(connection) with exclusive use of the reader's connection"""
+        name = str(reader)
+        with self._lock_for(name):
+            connection = self._connections.get(name)
+            if connection is not None:
+                try:
+                    return operation(connection)
+                except CardConnectionException:
+                    # Card was removed or reset since the last use; reconnect below
+                    self._discard(name)
+            connection = reader.createConnection()
+            connection.connect()
+            self._connections[name] = connection
+            try:
+                return operation(connection)
+            except CardConnectionException:
+                self._discard(name)
+                raise
+
+    def close(self):
+        with self._guard:
+            for name in list(self._connections):
+                self._discard(name)
+
+card_connections = CardConnectionPool()
+
+def _reader_info(i, reader, status="disconnected"):
+    """Base status entry for a real reader"""
+    return {
+        "id": f"real-reader-{i}",
+        "name": str(reader),
+        "type": "PC/SC",
+        "status": status,
+        "atr": None,
+        "protocol": None,
+        "is_real": True,
+        "_reader_obj": reader
+    }
+
+def _probe_reader(i, reader) -> dict:
+    """Connect to a single reader to check whether a card is present"""
+    reader_info = _reader_info(i, reader)
+    try:
+        atr, protocol = card_connections.run(reader, lambda connection: (connection.getATR(), connection.getProtocol()))
+        reader_info["status"] = "connected"
+        reader_info["atr"] = toHexString(atr)
+        reader_info["protocol"] = "T=0" if protocol == CardConnection.T0_protocol else "T=1"
+    except (NoCardException, CardConnectionException):
+        reader_info["status"] = "no_card"
+    return reader_info
+
+async def get_real_readers():
+    """Get list of actual connected PC/SC readers, probing them concurrently"""
     if not HARDWARE_MODE:
         return []
     try:
-        reader_list = readers()
-        result = []
-        for i, reader in enumerate(reader_list):
-            reader_info = {
-                "id": f"real-reader-{i}",
-                "name": str(reader),
-                "type": "PC/SC",
-                "status": "disconnected",
-                "atr": None,
-                "protocol": None,
-                "is_real": True,
-                "_reader_obj": reader
-            }
-            # Try to connect to check status
-            try:
-                connection = reader.createConnection()
-                connection.connect()
-                reader_info["status"] = "connected"
-                reader_info["atr"] = toHexString(connection.getATR())
-                reader_info["protocol"] = "T=0" if connection.getProtocol() == CardConnection.T0_protocol else "T=1"
-                connection.disconnect()
-            except (NoCardException, CardConnectionException):
-                reader_info["status"] = "no_card"
-            except Exception as e:
-                logger.error(f"Reader check error: {e}")
-            result.append(reader_info)
-        return result
+        reader_list = await asyncio.to_thread(readers)
     except Exception as e:
         logger.error(f"Error getting readers: {e}")
         return []
+    # Each probe blocks on connect/ATR, so run one thread per reader
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_probe_reader, i, reader) for i, reader in enumerate(reader_list)),
+        return_exceptions=True
+    )
+    reader_infos = []
+    for i, (reader, result) in enumerate(zip(reader_list, results)):
+        if isinstance(result, Exception):
+            logger.error(f"Reader check error: {result}")
+            result = _reader_info(i, reader, status="no_card")
+        reader_infos.append(result)
+    return reader_infos
+
+# Last probe result, reused for READER_CACHE_TTL seconds so UI polling
+# does not reopen a PC/SC connection to every reader on each request
+READER_CACHE_TTL = 2.0
+_reader_cache = {"ts": 0.0, "val": []}
+_reader_cache_lock = asyncio.Lock()
+
+async def get_real_readers_cached(ttl: float = READER_CACHE_TTL):
+    """Get connected PC/SC readers, re-probing at most once per ttl seconds"""
+    if time.monotonic() - _reader_cache["ts"] < ttl:
+        return _reader_cache["val"]
+    async with _reader_cache_lock:
+        # Another request may have refreshed the cache while we waited
+        if time.monotonic() - _reader_cache["ts"] >= ttl:
+            _reader_cache["val"] = await get_real_readers()
+            _reader_cache["ts"] = time.monotonic()
+        return _reader_cache["val"]
 
 def read_sim_file(connection, select_apdu, length=None):
     """Read a file from the SIM card"""
     try:
         # Select the file
         data, sw1, sw2 = connection.transmit(select_apdu)
-        if sw1 == 0x9F:  # Response data available
-            # Get response
+        if sw1 == 0x9F and length is None:  # Response data available
+            # The file header is only needed when the caller does not know the size
             get_resp = APDU_GET_RESPONSE + [sw2]
             data, sw1, sw2 = connection.transmit(get_resp)
         
@@ -262,16 +377,19 @@ def read_sim_file(connection, select_apdu, length=None):
         logger.error(f"Error reading SIM file: {e}")
         return None
 
+# BCD digits are stored low nibble first; swapping the nibbles of every byte
+# with bytes.translate lets bytes.hex() emit the digits in order in one C pass,
+# after which the 0xF filler nibbles are the only "f" characters left
+_SWAP_NIBBLES = bytes(((b & 0x0F) << 4) | (b >> 4) for b in range(256))
+
+def _decode_bcd(data) -> str:
+    return bytes(data).translate(_SWAP_NIBBLES).hex().replace("f", "")
+
 def decode_iccid(data):
     """Decode ICCID from raw bytes"""
     if not data:
         return None
-    iccid = ""
-    for byte in data:
-        iccid += str(byte & 0x0F)
-        if (byte >> 4) != 0x0F:
-            iccid += str(byte >> 4)
-    return iccid
+    return _decode_bcd(data)
 
 def decode_imsi(data):
     """Decode IMSI from raw bytes"""
@@ -279,91 +397,82 @@ def decode_imsi(data):
         return None
     # First byte is length, then BCD encoded IMSI
     length = data[0]
-    imsi = str(data[1] >> 4)  # First digit
-    for i in range(2, length + 1):
-        if i < len(data):
-            imsi += str(data[i] & 0x0F)
-            if (data[i] >> 4) != 0x0F:
-                imsi += str(data[i] >> 4)
-    return imsi
+    # First digit sits alone in the high nibble after the parity bits
+    return str(data[1] >> 4) + _decode_bcd(data[2:length + 1])
 
 def decode_spn(data):
     """Decode Service Provider Name"""
     if not data or len(data) < 2:
         return "Unknown"
-    # Skip first byte (display condition), then read string
-    spn_bytes = data[1:]
-    # Remove padding (0xFF bytes)
-    spn_bytes = bytes([b for b in spn_bytes if b != 0xFF])
+    # Skip first byte (display condition) and strip 0xFF padding
+    spn_bytes = bytes(data[1:]).replace(b'\xff', b'')
     try:
         return spn_bytes.decode('utf-8').strip() or spn_bytes.decode('latin-1').strip()
-    except:
+    except UnicodeDecodeError:
         return "Unknown"
 
-def read_real_card(reader_id: str):
+def _read_card_files(connection):
+    """Read ICCID, IMSI and SPN over an open card connection"""
+    atr = toHexString(connection.getATR())
+    
+    # Select Master File
+    connection.transmit(APDU_SELECT_MF)
+    
+    # Read ICCID (at MF level)
+    iccid_data = read_sim_file(connection, APDU_SELECT_EF_ICCID, 10)
+    iccid = decode_iccid(iccid_data) if iccid_data else "Unknown"
+    
+    # Select DF_GSM once for all the files below it
+    connection.transmit(APDU_SELECT_DF_GSM)
+    
+    # Read IMSI
+    imsi_data = read_sim_file(connection, APDU_SELECT_EF_IMSI, 9)
+    imsi = decode_imsi(imsi_data) if imsi_data else "Unknown"
+    
+    # Read SPN
+    spn_data = read_sim_file(connection, APDU_SELECT_EF_SPN, 17)
+    spn = decode_spn(spn_data) if spn_data else "Unknown Carrier"
+    
+    # Extract MCC/MNC from IMSI
+    mcc = imsi[:3] if imsi and len(imsi) >= 3 else "000"
+    mnc = imsi[3:5] if imsi and len(imsi) >= 5 else "00"
+    
+    return {
+        "iccid": iccid,
+        "imsi": imsi,
+        "mcc": mcc,
+        "mnc": mnc,
+        "spn": spn,
+        "atr": atr,
+        "is_real": True
+    }
+
+def read_real_card(reader):
     """Read actual card data from a connected reader"""
     if not HARDWARE_MODE:
         return None
     
     try:
-        reader_list = readers()
-        reader_index = int(reader_id.split('-')[-1])
-        if reader_index >= len(reader_list):
-            return None
-        
-        reader = reader_list[reader_index]
-        connection = reader.createConnection()
-        connection.connect()
-        
-        atr = toHexString(connection.getATR())
-        
-        # Select Master File
-        connection.transmit(APDU_SELECT_MF)
-        
-        # Read ICCID (at MF level)
-        iccid_data = read_sim_file(connection, APDU_SELECT_EF_ICCID, 10)
-        iccid = decode_iccid(iccid_data) if iccid_data else "Unknown"
-        
-        # Select DF_GSM
-        connection.transmit(APDU_SELECT_DF_GSM)
-        
-        # Read IMSI
-        imsi_data = read_sim_file(connection, APDU_SELECT_EF_IMSI, 9)
-        imsi = decode_imsi(imsi_data) if imsi_data else "Unknown"
-        
-        # Read SPN
-        spn_data = read_sim_file(connection, APDU_SELECT_EF_SPN, 17)
-        spn = decode_spn(spn_data) if spn_data else "Unknown Carrier"
-        
-        # Extract MCC/MNC from IMSI
-        mcc = imsi[:3] if imsi and len(imsi) >= 3 else "000"
-        mnc = imsi[3:5] if imsi and len(imsi) >= 5 else "00"
-        
-        connection.disconnect()
-        
-        return {
-            "iccid": iccid,
-            "imsi": imsi,
-            "mcc": mcc,
-            "mnc": mnc,
-            "spn": spn,
-            "atr": atr,
-            "is_real": True
-        }
+        return card_connections.run(reader, _read_card_files)
     except NoCardException:
         raise HTTPException(status_code=400, detail="No card in reader")
     except Exception as e:
         logger.error(f"Error reading card: {e}")
         raise HTTPException(status_code=500, detail=f"Card read error: {str(e)}")
 
-def generate_qr_code(data: str) -> Optional[str]:
-    """Generate real QR code and return as base64"""
+QR_CODE_OPTIONS = {"version": 1, "box_size": 10, "border": 4}
+
+def generate_qr_code(data: str, media: str = "png") -> Optional[str]:
+    """Generate real QR code and return as base64 PNG (or SVG markup for media='svg')"""
     if not QR_MODE:
         return None
     try:
-        qr = qrcode.QRCode(version=1, box_size=10, border=4)
+        qr = qrcode.QRCode(**QR_CODE_OPTIONS)
         qr.add_data(data)
         qr.make(fit=True)
+        if media == "svg":
+            # A single SVG path is far cheaper to produce than a PIL-encoded PNG
+            return qr.make_image(image_factory=SvgPathImage).to_string(encoding="unicode")
         img = qr.make_image(fill_color="black", back_color="white")
         
         buffer = io.BytesIO()
@@ -374,12 +483,165 @@ def generate_qr_code(data: str) -> Optional[str]:
         logger.error(f"QR generation error: {e}")
         return None
 
+# ============== DATABASE HELPERS ==============
+
+def projection(model) -> dict:
+    """Mongo projection returning only the fields of a response model"""
+    return {"_id": 0, **{field: 1 for field in model.model_fields}}
+
+CARD_PROJECTION = projection(CardInfo)
+CARD_SUMMARY_PROJECTION = projection(CardSummary)
+CONTACT_PROJECTION = projection(Contact)
+SMS_PROJECTION = projection(SMS)
+ACTIVITY_LOG_PROJECTION = projection(ActivityLog)
+SECURITY_ANALYSIS_PROJECTION = projection(SecurityAnalysis)
+ESIM_PROFILE_PROJECTION = projection(EsimProfile)
+
+# Contact and SMS lists are capped at LIST_LIMIT documents; fetching them in a
+# batch of the same size returns the whole list in one round-trip
+LIST_LIMIT = 1000
+
+READ_CACHE_TTL = 2.0
+
+class ReadCache:
+    """Short-lived in-process cache for polled list endpoints, cleared by writes"""
+    
+    def __init__(self, ttl: float = READ_CACHE_TTL, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = {}
+        self._generation = 0
+    
+    async def get_or_load(self, key, load):
+        """Return the cached value for key, or await load() and cache its result"""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and now - entry[0] < self.ttl:
+            return entry[1]
+        generation = self._generation
+        value = await load()
+        # Don't cache a result that a write may have made stale while it loaded
+        if generation == self._generation:
+            if len(self._entries) >= self.maxsize:
+                self._entries.clear()
+            self._entries[key] = (now, value)
+        return value
+    
+    def invalidate(self):
+        self._generation += 1
+        self._entries.clear()
+
+card_list_cache = ReadCache()
+contact_list_cache = ReadCache()
+
+async def next_sequence(name: str, count: int = 1) -> int:
+    """Atomically advance a named counter by count and return its new value"""
+    counter = await db.counters.find_one_and_update(
+        {"_id": name},
+        {"$inc": {"seq": count}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    return counter["seq"]
+
+async def insert_contacts(card_id: str, contacts: List[ContactCreate]) -> List[Contact]:
+    """Insert several contacts for a card with one counter update and one insert_many"""
+    if not contacts:
+        return []
+    first_index = await next_sequence(f"contacts:{card_id}", len(contacts)) - len(contacts) + 1
+    new_contacts = [
+        Contact(
+            card_id=card_id,
+            index=first_index + i,
+            name=contact.name,
+            number=contact.number,
+            group=contact.group,
+            email=contact.email
+        )
+        for i, contact in enumerate(contacts)
+    ]
+    await db.contacts.insert_many([contact.model_dump() for contact in new_contacts], ordered=False)
+    contact_list_cache.invalidate()
+    return new_contacts
+
+async def insert_sms(card_id: str, messages: List[SMSCreate]) -> List[SMS]:
+    """Insert several SMS for a card with one counter update and one insert_many"""
+    if not messages:
+        return []
+    first_index = await next_sequence(f"sms:{card_id}", len(messages)) - len(messages) + 1
+    now = datetime.now(timezone.utc)
+    new_messages = [
+        SMS(
+            card_id=card_id,
+            index=first_index + i,
+            sender=sms.sender,
+            recipient=sms.recipient,
+            message=sms.message,
+            timestamp=now,
+            status=sms.status
+        )
+        for i, sms in enumerate(messages)
+    ]
+    await db.sms.insert_many([sms.model_dump() for sms in new_messages], ordered=False)
+    return new_messages
+
+async def no_documents():
+    """Empty query result, for optional branches of asyncio.gather"""
+    return []
+
+async def seed_sequence(name: str, value: int):
+    """Raise a named counter to at least value (used after bulk copies)"""
+    await db.counters.update_one({"_id": name}, {"$max": {"seq": value}}, upsert=True)
+
+TIMESTAMPED_COLLECTIONS = ("cards", "sms", "activity_logs", "security_analysis", "esim_profiles")
+
+async def migrate_string_timestamps():
+    """Convert ISO timestamp strings left by older releases into BSON dates"""
+    results = await asyncio.gather(*(
+        db[name].update_many(
+            {"timestamp": {"$type": "string"}},
+            [{"$set": {"timestamp": {"$dateFromString": {"dateString": "$timestamp", "onError": "$timestamp"}}}}]
+        )
+        for name in TIMESTAMPED_COLLECTIONS
+    ))
+    for name, result in zip(TIMESTAMPED_COLLECTIONS, results):
+        if result.modified_count:
+            logger.info(f"Converted {result.modified_count} string timestamps in {name}")
+
+async def seed_sequences_from_indexes():
+    """Raise each card's contact/SMS counter to the highest index already stored"""
+    # Cards written before the counters existed would otherwise restart at index 1
+    await asyncio.gather(*(
+        db[name].aggregate([
+            {"$match": {"card_id": {"$type": "string"}, "index": {"$type": "number"}}},
+            {"$group": {"_id": {"$concat": [f"{name}:", "$card_id"]}, "seq": {"$max": "$index"}}},
+            {"$merge": {
+                "into": "counters",
+                "on": "_id",
+                "whenMatched": [{"$set": {"seq": {"$max": ["$seq", "$$new.seq"]}}}],
+                "whenNotMatched": "insert"
+            }}
+        ])
+        for name in ("contacts", "sms")
+    ))
+
+# Bump when a new one-time upgrade is added to run_migrations
+SCHEMA_VERSION = 1
+
+async def run_migrations():
+    """Apply the one-time data upgrades unless this database has already had them"""
+    marker = await db.counters.find_one({"_id": "schema_version"})
+    if marker and marker.get("version", 0) >= SCHEMA_VERSION:
+        return
+    await asyncio.gather(migrate_string_timestamps(), seed_sequences_from_indexes())
+    await db.counters.update_one({"_id": "schema_version"}, {"$max": {"version": SCHEMA_VERSION}}, upsert=True)
+
 # ============== READER ENDPOINTS ==============
 
 @api_router.get("/readers", response_model=List[ReaderStatus])
 async def get_readers():
     """Get list of connected PC/SC readers (real + simulated fallback)"""
-    real_readers = get_real_readers()
+    real_readers = await get_real_readers_cached()
     
     if real_readers:
         # Return only real readers if hardware is available
@@ -401,23 +663,24 @@ async def get_readers():
 @api_router.get("/hardware/status")
 async def hardware_status():
     """Check if real hardware is available"""
+    real_readers = await get_real_readers_cached()
     return {
         "hardware_mode": HARDWARE_MODE,
         "qr_mode": QR_MODE,
-        "real_readers_count": len(get_real_readers()) if HARDWARE_MODE else 0,
+        "real_readers_count": len(real_readers),
         "message": "Real hardware available" if HARDWARE_MODE else "Install pyscard for real hardware support"
     }
 
 @api_router.post("/readers/{reader_id}/connect")
 async def connect_reader(reader_id: str):
     """Connect to a specific reader"""
-    await log_activity("READER_CONNECT", f"Connected to reader {reader_id}")
+    log_activity("READER_CONNECT", f"Connected to reader {reader_id}")
     return {"status": "connected", "reader_id": reader_id, "is_real": reader_id.startswith("real-")}
 
 @api_router.post("/readers/{reader_id}/disconnect")
 async def disconnect_reader(reader_id: str):
     """Disconnect from a reader"""
-    await log_activity("READER_DISCONNECT", f"Disconnected from reader {reader_id}")
+    log_activity("READER_DISCONNECT", f"Disconnected from reader {reader_id}")
     return {"status": "disconnected", "reader_id": reader_id}
 
 # ============== CARD ENDPOINTS ==============
@@ -425,21 +688,23 @@ async def disconnect_reader(reader_id: str):
 @api_router.get("/cards", response_model=List[CardInfo])
 async def get_cards():
     """Get all scanned cards"""
-    cards = await db.cards.find({}, {"_id": 0}).to_list(100)
-    for card in cards:
-        if isinstance(card.get('timestamp'), str):
-            card['timestamp'] = datetime.fromisoformat(card['timestamp'])
-    return cards
+    # Documents come from our own writes, so they are returned without re-validation
+    cards = await card_list_cache.get_or_load("full", lambda: db.cards.find({}, CARD_PROJECTION).to_list(100))
+    return ORJSONResponse(cards)
+
+@api_router.get("/cards/summary", response_model=List[CardSummary])
+async def get_card_summaries():
+    """Get all scanned cards with only the fields needed for card pickers"""
+    cards = await card_list_cache.get_or_load("summary", lambda: db.cards.find({}, CARD_SUMMARY_PROJECTION).to_list(100))
+    return ORJSONResponse(cards)
 
 @api_router.get("/cards/{card_id}", response_model=CardInfo)
 async def get_card(card_id: str):
     """Get specific card details"""
-    card = await db.cards.find_one({"id": card_id}, {"_id": 0})
+    card = await db.cards.find_one({"id": card_id}, CARD_PROJECTION)
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
-    if isinstance(card.get('timestamp'), str):
-        card['timestamp'] = datetime.fromisoformat(card['timestamp'])
-    return card
+    return ORJSONResponse(card)
 
 @api_router.post("/cards/read")
 async def read_card(reader_id: str = Query(...)):
@@ -448,7 +713,11 @@ async def read_card(reader_id: str = Query(...)):
     
     if is_real_reader and HARDWARE_MODE:
         # Read from real hardware
-        card_data_raw = read_real_card(reader_id)
+        real_readers = await get_real_readers_cached()
+        reader = next((r["_reader_obj"] for r in real_readers if r["id"] == reader_id), None)
+        if reader is None:
+            raise HTTPException(status_code=404, detail="Reader not found")
+        card_data_raw = await asyncio.to_thread(read_real_card, reader)
         card_data = CardInfo(
             iccid=card_data_raw["iccid"],
             imsi=card_data_raw["imsi"],
@@ -471,21 +740,28 @@ async def read_card(reader_id: str = Query(...)):
             is_real=False
         )
     
-    doc = card_data.model_dump()
-    doc['timestamp'] = doc['timestamp'].isoformat()
-    await db.cards.insert_one(doc)
-    await log_activity("CARD_READ", f"Read card ICCID: {card_data.iccid} (Real: {card_data.is_real})", card_data.id)
+    await db.cards.insert_one(card_data.model_dump())
+    card_list_cache.invalidate()
+    log_activity("CARD_READ", f"Read card ICCID: {card_data.iccid} (Real: {card_data.is_real})", card_data.id)
     return card_data
 
 @api_router.delete("/cards/{card_id}")
 async def delete_card(card_id: str):
     """Delete a card and all associated data"""
-    result = await db.cards.delete_one({"id": card_id})
-    await db.contacts.delete_many({"card_id": card_id})
-    await db.sms.delete_many({"card_id": card_id})
+    # The cascade touches independent collections, so run the deletes together
+    result, *_ = await asyncio.gather(
+        db.cards.delete_one({"id": card_id}),
+        db.contacts.delete_many({"card_id": card_id}),
+        db.sms.delete_many({"card_id": card_id}),
+        db.security_analysis.delete_many({"card_id": card_id}),
+        db.esim_profiles.delete_many({"card_id": card_id}),
+        db.counters.delete_many({"_id": {"$in": [f"contacts:{card_id}", f"sms:{card_id}"]}})
+    )
+    card_list_cache.invalidate()
+    contact_list_cache.invalidate()
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Card not found")
-    await log_activity("CARD_DELETE", f"Deleted card {card_id}", card_id)
+    log_activity("CARD_DELETE", f"Deleted card {card_id}", card_id)
     return {"status": "deleted", "card_id": card_id}
 
 # ============== CONTACTS ENDPOINTS ==============
@@ -494,25 +770,37 @@ async def delete_card(card_id: str):
 async def get_contacts(card_id: Optional[str] = None):
     """Get contacts, optionally filtered by card"""
     query = {"card_id": card_id} if card_id else {}
-    contacts = await db.contacts.find(query, {"_id": 0}).to_list(1000)
-    return contacts
+    contacts = await contact_list_cache.get_or_load(card_id, lambda: db.contacts.find(query, CONTACT_PROJECTION).batch_size(LIST_LIMIT).to_list(LIST_LIMIT))
+    return ORJSONResponse(contacts)
 
 @api_router.post("/contacts", response_model=Contact)
 async def create_contact(contact: ContactCreate):
     """Create a new contact"""
-    count = await db.contacts.count_documents({"card_id": contact.card_id})
+    index = await next_sequence(f"contacts:{contact.card_id}")
     new_contact = Contact(
         card_id=contact.card_id,
-        index=count + 1,
+        index=index,
         name=contact.name,
         number=contact.number,
         group=contact.group,
         email=contact.email
     )
     await db.contacts.insert_one(new_contact.model_dump())
-    await log_activity("CONTACT_CREATE", f"Created contact: {contact.name}", contact.card_id)
+    contact_list_cache.invalidate()
+    log_activity("CONTACT_CREATE", f"Created contact: {contact.name}", contact.card_id)
     return new_contact
 
+@api_router.post("/contacts/bulk", response_model=List[Contact])
+async def create_contacts_bulk(request: ContactBulkCreate):
+    """Create several contacts for a card in one request"""
+    card = await db.cards.find_one({"id": request.card_id}, {"_id": 1})
+    if not card:
+        raise HTTPException(status_code=404, detail="Card not found")
+    contacts = [ContactCreate(card_id=request.card_id, **entry.model_dump()) for entry in request.contacts]
+    new_contacts = await insert_contacts(request.card_id, contacts)
+    log_activity("CONTACT_BULK_CREATE", f"Created {len(new_contacts)} contacts", request.card_id)
+    return new_contacts
+
 @api_router.put("/contacts/{contact_id}", response_model=Contact)
 async def update_contact(contact_id: str, update: ContactUpdate):
     """Update a contact"""
@@ -520,25 +808,27 @@ async def update_contact(contact_id: str, update: ContactUpdate):
     if not update_data:
         raise HTTPException(status_code=400, detail="No data to update")
     result = await db.contacts.update_one({"id": contact_id}, {"$set": update_data})
+    contact_list_cache.invalidate()
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Contact not found")
     contact = await db.contacts.find_one({"id": contact_id}, {"_id": 0})
-    await log_activity("CONTACT_UPDATE", f"Updated contact: {contact_id}")
+    log_activity("CONTACT_UPDATE", f"Updated contact: {contact_id}")
     return contact
 
 @api_router.delete("/contacts/{contact_id}")
 async def delete_contact(contact_id: str):
     """Delete a contact"""
     result = await db.contacts.delete_one({"id": contact_id})
+    contact_list_cache.invalidate()
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Contact not found")
-    await log_activity("CONTACT_DELETE", f"Deleted contact: {contact_id}")
+    log_activity("CONTACT_DELETE", f"Deleted contact: {contact_id}")
     return {"status": "deleted", "contact_id": contact_id}
 
 @api_router.post("/contacts/write/{card_id}")
 async def write_contacts_to_card(card_id: str):
     """Write all contacts to the physical SIM card"""
-    contacts = await db.contacts.find({"card_id": card_id}, {"_id": 0}).to_list(1000)
+    contacts = await db.contacts.find({"card_id": card_id}, {"_id": 0}).batch_size(LIST_LIMIT).to_list(LIST_LIMIT)
     
     # Check if this is a real card
     card = await db.cards.find_one({"id": card_id}, {"_id": 0})
@@ -547,7 +837,7 @@ async def write_contacts_to_card(card_id: str):
         # This requires careful implementation to not damage the SIM
         pass
     
-    await log_activity("CONTACTS_WRITE", f"Wrote {len(contacts)} contacts to card", card_id)
+    log_activity("CONTACTS_WRITE", f"Wrote {len(contacts)} contacts to card", card_id)
     return {"status": "success", "contacts_written": len(contacts)}
 
 # ============== SMS ENDPOINTS ==============
@@ -556,29 +846,24 @@ async def write_contacts_to_card(card_id: str):
 async def get_sms(card_id: Optional[str] = None):
     """Get SMS messages, optionally filtered by card"""
     query = {"card_id": card_id} if card_id else {}
-    messages = await db.sms.find(query, {"_id": 0}).to_list(1000)
-    for msg in messages:
-        if isinstance(msg.get('timestamp'), str):
-            msg['timestamp'] = datetime.fromisoformat(msg['timestamp'])
-    return messages
+    messages = await db.sms.find(query, SMS_PROJECTION).batch_size(LIST_LIMIT).to_list(LIST_LIMIT)
+    return ORJSONResponse(messages)
 
 @api_router.post("/sms", response_model=SMS)
 async def create_sms(sms: SMSCreate):
     """Create a new SMS entry"""
-    count = await db.sms.count_documents({"card_id": sms.card_id})
+    index = await next_sequence(f"sms:{sms.card_id}")
     new_sms = SMS(
         card_id=sms.card_id,
-        index=count + 1,
+        index=index,
         sender=sms.sender,
         recipient=sms.recipient,
         message=sms.message,
         timestamp=datetime.now(timezone.utc),
         status=sms.status
     )
-    doc = new_sms.model_dump()
-    doc['timestamp'] = doc['timestamp'].isoformat()
-    await db.sms.insert_one(doc)
-    await log_activity("SMS_CREATE", f"Created SMS from {sms.sender}", sms.card_id)
+    await db.sms.insert_one(new_sms.model_dump())
+    log_activity("SMS_CREATE", f"Created SMS from {sms.sender}", sms.card_id)
     return new_sms
 
 @api_router.delete("/sms/{sms_id}")
@@ -587,7 +872,7 @@ async def delete_sms(sms_id: str):
     result = await db.sms.delete_one({"id": sms_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="SMS not found")
-    await log_activity("SMS_DELETE", f"Deleted SMS: {sms_id}")
+    log_activity("SMS_DELETE", f"Deleted SMS: {sms_id}")
     return {"status": "deleted", "sms_id": sms_id}
 
 # ============== CLONE ENDPOINTS ==============
@@ -595,7 +880,12 @@ async def delete_sms(sms_id: str):
 @api_router.post("/clone")
 async def clone_card(request: CloneRequest):
     """Clone card data to a new card"""
-    source_card = await db.cards.find_one({"id": request.source_card_id}, {"_id": 0})
+    # The three reads are independent, so issue them together
+    source_card, contacts, messages = await asyncio.gather(
+        db.cards.find_one({"id": request.source_card_id}, {"_id": 0}),
+        db.contacts.find({"card_id": request.source_card_id}, {"_id": 0}).batch_size(LIST_LIMIT).to_list(LIST_LIMIT) if request.clone_contacts else no_documents(),
+        db.sms.find({"card_id": request.source_card_id}, {"_id": 0}).batch_size(LIST_LIMIT).to_list(LIST_LIMIT) if request.clone_sms else no_documents()
+    )
     if not source_card:
         raise HTTPException(status_code=404, detail="Source card not found")
     
@@ -609,45 +899,52 @@ async def clone_card(request: CloneRequest):
         card_type=source_card['card_type'],
         is_real=False  # Cloned data is stored locally
     )
-    doc = cloned_card.model_dump()
-    doc['timestamp'] = doc['timestamp'].isoformat()
-    await db.cards.insert_one(doc)
+    await db.cards.insert_one(cloned_card.model_dump())
+    card_list_cache.invalidate()
     
     cloned_contacts = 0
     cloned_sms = 0
     
     if request.clone_contacts:
-        contacts = await db.contacts.find({"card_id": request.source_card_id}, {"_id": 0}).to_list(1000)
-        for contact in contacts:
-            new_contact = Contact(
-                card_id=cloned_card.id,
-                index=contact['index'],
-                name=contact['name'],
-                number=contact['number'],
-                group=contact.get('group'),
-                email=contact.get('email')
-            )
-            await db.contacts.insert_one(new_contact.model_dump())
-            cloned_contacts += 1
+        # Source rows were validated when written, so copy them without a model round-trip
+        new_contact_docs = [
+            {
+                "id": str(uuid.uuid4()),
+                "card_id": cloned_card.id,
+                "index": contact['index'],
+                "name": contact['name'],
+                "number": contact['number'],
+                "group": contact.get('group'),
+                "email": contact.get('email')
+            }
+            for contact in contacts
+        ]
+        if new_contact_docs:
+            await db.contacts.insert_many(new_contact_docs, ordered=False, bypass_document_validation=True)
+            contact_list_cache.invalidate()
+            await seed_sequence(f"contacts:{cloned_card.id}", max(d['index'] for d in new_contact_docs))
+        cloned_contacts = len(new_contact_docs)
     
     if request.clone_sms:
-        messages = await db.sms.find({"card_id": request.source_card_id}, {"_id": 0}).to_list(1000)
-        for msg in messages:
-            new_sms = SMS(
-                card_id=cloned_card.id,
-                index=msg['index'],
-                sender=msg['sender'],
-                recipient=msg['recipient'],
-                message=msg['message'],
-                timestamp=datetime.fromisoformat(msg['timestamp']) if isinstance(msg['timestamp'], str) else msg['timestamp'],
-                status=msg['status']
-            )
-            doc = new_sms.model_dump()
-            doc['timestamp'] = doc['timestamp'].isoformat()
-            await db.sms.insert_one(doc)
-            cloned_sms += 1
+        new_sms_docs = [
+            {
+                "id": str(uuid.uuid4()),
+                "card_id": cloned_card.id,
+                "index": msg['index'],
+                "sender": msg['sender'],
+                "recipient": msg['recipient'],
+                "message": msg['message'],
+                "timestamp": msg['timestamp'],
+                "status": msg['status']
+            }
+            for msg in messages
+        ]
+        if new_sms_docs:
+            await db.sms.insert_many(new_sms_docs, ordered=False, bypass_document_validation=True)
+            await seed_sequence(f"sms:{cloned_card.id}", max(d['index'] for d in new_sms_docs))
+        cloned_sms = len(new_sms_docs)
     
-    await log_activity("CARD_CLONE", f"Cloned card {request.source_card_id} to {cloned_card.id}", cloned_card.id)
+    log_activity("CARD_CLONE", f"Cloned card {request.source_card_id} to {cloned_card.id}", cloned_card.id)
     
     return {
         "status": "success",
@@ -698,21 +995,16 @@ async def analyze_card_security(card_id: str):
         recommendations=recommendations
     )
     
-    doc = analysis.model_dump()
-    doc['timestamp'] = doc['timestamp'].isoformat()
-    await db.security_analysis.insert_one(doc)
-    await log_activity("SECURITY_ANALYSIS", f"Security analysis completed for card {card_id}", card_id)
+    await db.security_analysis.insert_one(analysis.model_dump())
+    log_activity("SECURITY_ANALYSIS", f"Security analysis completed for card {card_id}", card_id)
     
     return analysis
 
 @api_router.get("/analyze/{card_id}/history", response_model=List[SecurityAnalysis])
 async def get_analysis_history(card_id: str):
     """Get security analysis history for a card"""
-    analyses = await db.security_analysis.find({"card_id": card_id}, {"_id": 0}).to_list(100)
-    for analysis in analyses:
-        if isinstance(analysis.get('timestamp'), str):
-            analysis['timestamp'] = datetime.fromisoformat(analysis['timestamp'])
-    return analyses
+    analyses = await db.security_analysis.find({"card_id": card_id}, SECURITY_ANALYSIS_PROJECTION).to_list(100)
+    return ORJSONResponse(analyses)
 
 # ============== ESIM CONVERSION ==============
 
@@ -727,48 +1019,53 @@ async def convert_to_esim(request: EsimConvertRequest):
     activation_code = f"LPA:1${request.carrier.upper()}.COM$SGP.{card['imsi'][-6:]}"
     qr_data = f"LPA:1${request.carrier.upper()}.ESIM.PROFILE${card['iccid'][-10:]}.{uuid.uuid4().hex[:8].upper()}"
     
-    # Generate real QR code if library available
-    qr_image_base64 = generate_qr_code(qr_data)
+    # Generate real QR codes if library available
+    qr_image_base64, qr_image_svg = await asyncio.gather(
+        asyncio.to_thread(generate_qr_code, qr_data),
+        asyncio.to_thread(generate_qr_code, qr_data, "svg")
+    )
     
     esim_profile = EsimProfile(
         card_id=request.card_id,
         activation_code=activation_code,
         qr_data=qr_data,
         qr_image_base64=qr_image_base64,
+        qr_image_svg=qr_image_svg,
         profile_name=request.profile_name,
         carrier=request.carrier,
         status="ready"
     )
     
-    doc = esim_profile.model_dump()
-    doc['timestamp'] = doc['timestamp'].isoformat()
-    await db.esim_profiles.insert_one(doc)
-    await log_activity("ESIM_CONVERT", f"Generated eSIM profile for card {request.card_id}", request.card_id)
+    await db.esim_profiles.insert_one(esim_profile.model_dump())
+    log_activity("ESIM_CONVERT", f"Generated eSIM profile for card {request.card_id}", request.card_id)
     
     return esim_profile
 
 @api_router.get("/esim/{card_id}", response_model=List[EsimProfile])
 async def get_esim_profiles(card_id: str):
     """Get eSIM profiles for a card"""
-    profiles = await db.esim_profiles.find({"card_id": card_id}, {"_id": 0}).to_list(100)
-    for profile in profiles:
-        if isinstance(profile.get('timestamp'), str):
-            profile['timestamp'] = datetime.fromisoformat(profile['timestamp'])
-    return profiles
+    profiles = await db.esim_profiles.find({"card_id": card_id}, ESIM_PROFILE_PROJECTION).to_list(100)
+    return ORJSONResponse(profiles)
 
 @api_router.get("/esim/qr/{profile_id}")
-async def get_esim_qr_image(profile_id: str):
+async def get_esim_qr_image(profile_id: str, format: str = Query("png", enum=["png", "svg"])):
     """Get QR code image for an eSIM profile"""
     profile = await db.esim_profiles.find_one({"id": profile_id}, {"_id": 0})
     if not profile:
         raise HTTPException(status_code=404, detail="Profile not found")
     
+    if format == "svg":
+        svg = profile.get("qr_image_svg") or await asyncio.to_thread(generate_qr_code, profile["qr_data"], "svg")
+        if svg:
+            return Response(content=svg, media_type="image/svg+xml")
+        raise HTTPException(status_code=500, detail="QR generation not available - install qrcode library")
+    
     if profile.get("qr_image_base64"):
         image_data = base64.b64decode(profile["qr_image_base64"])
         return Response(content=image_data, media_type="image/png")
     
     # Generate on the fly if not stored
-    qr_base64 = generate_qr_code(profile["qr_data"])
+    qr_base64 = await asyncio.to_thread(generate_qr_code, profile["qr_data"])
     if qr_base64:
         image_data = base64.b64decode(qr_base64)
         return Response(content=image_data, media_type="image/png")
@@ -777,6 +1074,86 @@ async def get_esim_qr_image(profile_id: str):
 
 # ============== EXPORT/IMPORT ==============
 
+def _dump_json(value) -> bytes:
+    return orjson.dumps(value, option=orjson.OPT_NAIVE_UTC)
+
+# Documents fetched per round-trip, and sent per chunk, while streaming an export
+EXPORT_BATCH_SIZE = 500
+
+async def _stream_json_array(cursor):
+    """Yield the comma-separated JSON encoding of a cursor's documents, one chunk per batch"""
+    separator = b""
+    batch = []
+    async for doc in cursor:
+        batch.append(_dump_json(doc))
+        if len(batch) >= EXPORT_BATCH_SIZE:
+            yield separator + b",".join(batch)
+            separator = b","
+            batch = []
+    if batch:
+        yield separator + b",".join(batch)
+
+async def stream_json_export(card: dict):
+    """Yield a card export as JSON, one batch of documents at a time"""
+    yield b'{"card":' + _dump_json(card) + b',"contacts":['
+    async for chunk in _stream_json_array(db.contacts.find({"card_id": card["id"]}, {"_id": 0}).batch_size(EXPORT_BATCH_SIZE)):
+        yield chunk
+    yield b'],"sms":['
+    async for chunk in _stream_json_array(db.sms.find({"card_id": card["id"]}, {"_id": 0}).batch_size(EXPORT_BATCH_SIZE)):
+        yield chunk
+    yield (
+        b'],"exported_at":' + _dump_json(datetime.now(timezone.utc))
+        + b',"exported_by":"SimGuard Pro Standalone"}'
+    )
+
+# Column order for each CSV section, fixed by the stored models
+CARD_CSV_FIELDS = tuple(CardInfo.model_fields)
+CONTACT_CSV_FIELDS = tuple(Contact.model_fields)
+SMS_CSV_FIELDS = tuple(SMS.model_fields)
+
+def _csv_field(value) -> str:
+    """Format one CSV cell, quoting it only if it holds a comma, quote or line break"""
+    if value is None:
+        return ""
+    text = value.isoformat() if isinstance(value, datetime) else str(value)
+    if ',' in text or '"' in text or '\n' in text or '\r' in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+def _compile_csv_row(fields: tuple):
+    """Generate a function that formats a document as one CSV line over fields"""
+    cells = ",".join("{_csv_field(doc.get(%r))}" % field for field in fields)
+    return eval('lambda doc: f"%s\\n"' % cells, {"_csv_field": _csv_field})
+
+_format_card_row = _compile_csv_row(CARD_CSV_FIELDS)
+_format_contact_row = _compile_csv_row(CONTACT_CSV_FIELDS)
+_format_sms_row = _compile_csv_row(SMS_CSV_FIELDS)
+
+async def _stream_csv_rows(cursor, fields: tuple, format_row):
+    """Yield a header and then a cursor's documents as CSV lines, one chunk per batch"""
+    header = ",".join(fields) + "\n"
+    rows = []
+    async for doc in cursor:
+        rows.append(format_row(doc))
+        if len(rows) >= EXPORT_BATCH_SIZE:
+            yield header + "".join(rows)
+            header = ""
+            rows = []
+    if rows:
+        yield header + "".join(rows)
+
+async def stream_csv_export(card: dict):
+    """Yield a card export as CSV sections, one batch of rows at a time"""
+    yield (
+        "=== CARD INFO ===\n" + ",".join(CARD_CSV_FIELDS) + "\n"
+        + _format_card_row(card) + "\n=== CONTACTS ===\n"
+    )
+    async for chunk in _stream_csv_rows(db.contacts.find({"card_id": card["id"]}, {"_id": 0}).batch_size(EXPORT_BATCH_SIZE), CONTACT_CSV_FIELDS, _format_contact_row):
+        yield chunk
+    yield "\n=== SMS ===\n"
+    async for chunk in _stream_csv_rows(db.sms.find({"card_id": card["id"]}, {"_id": 0}).batch_size(EXPORT_BATCH_SIZE), SMS_CSV_FIELDS, _format_sms_row):
+        yield chunk
+
 @api_router.get("/export/{card_id}")
 async def export_card_data(card_id: str, format: str = Query("json", enum=["json", "csv"])):
     """Export card data in JSON or CSV format"""
@@ -784,46 +1161,17 @@ async def export_card_data(card_id: str, format: str = Query("json", enum=["json
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
     
-    contacts = await db.contacts.find({"card_id": card_id}, {"_id": 0}).to_list(1000)
-    messages = await db.sms.find({"card_id": card_id}, {"_id": 0}).to_list(1000)
-    
+    # Contacts and SMS are streamed straight from their cursors
     if format == "json":
-        export_data = {
-            "card": card,
-            "contacts": contacts,
-            "sms": messages,
-            "exported_at": datetime.now(timezone.utc).isoformat(),
-            "exported_by": "SimGuard Pro Standalone"
-        }
-        content = json.dumps(export_data, indent=2, default=str)
         return StreamingResponse(
-            io.StringIO(content),
+            stream_json_export(card),
             media_type="application/json",
             headers={"Content-Disposition": f"attachment; filename=simguard_export_{card_id}.json"}
         )
     else:
-        output = io.StringIO()
-        output.write("=== CARD INFO ===\n")
-        writer = csv.DictWriter(output, fieldnames=list(card.keys()))
-        writer.writeheader()
-        writer.writerow(card)
-        
-        output.write("\n=== CONTACTS ===\n")
-        if contacts:
-            writer = csv.DictWriter(output, fieldnames=list(contacts[0].keys()))
-            writer.writeheader()
-            writer.writerows(contacts)
-        
-        output.write("\n=== SMS ===\n")
-        if messages:
-            writer = csv.DictWriter(output, fieldnames=list(messages[0].keys()))
-            writer.writeheader()
-            writer.writerows(messages)
-        
-        output.seek(0)
-        await log_activity("DATA_EXPORT", f"Exported card data in {format} format", card_id)
+        log_activity("DATA_EXPORT", f"Exported card data in {format} format", card_id)
         return StreamingResponse(
-            output,
+            stream_csv_export(card),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename=simguard_export_{card_id}.csv"}
         )
@@ -839,30 +1187,32 @@ async def import_card_data(data: ImportData):
     imported_sms = 0
     
     if data.data_type in ["contacts", "all"] and "contacts" in data.data:
-        for contact_data in data.data["contacts"]:
-            contact = ContactCreate(
+        contacts = [
+            ContactCreate(
                 card_id=data.card_id,
                 name=contact_data["name"],
                 number=contact_data["number"],
                 group=contact_data.get("group"),
                 email=contact_data.get("email")
             )
-            await create_contact(contact)
-            imported_contacts += 1
+            for contact_data in data.data["contacts"]
+        ]
+        imported_contacts = len(await insert_contacts(data.card_id, contacts))
     
     if data.data_type in ["sms", "all"] and "sms" in data.data:
-        for sms_data in data.data["sms"]:
-            sms = SMSCreate(
+        messages = [
+            SMSCreate(
                 card_id=data.card_id,
                 sender=sms_data["sender"],
                 recipient=sms_data["recipient"],
                 message=sms_data["message"],
                 status=sms_data.get("status", "read")
             )
-            await create_sms(sms)
-            imported_sms += 1
+            for sms_data in data.data["sms"]
+        ]
+        imported_sms = len(await insert_sms(data.card_id, messages))
     
-    await log_activity("DATA_IMPORT", f"Imported {imported_contacts} contacts, {imported_sms} SMS", data.card_id)
+    log_activity("DATA_IMPORT", f"Imported {imported_contacts} contacts, {imported_sms} SMS", data.card_id)
     
     return {
         "status": "success",
@@ -872,27 +1222,70 @@ async def import_card_data(data: ImportData):
 
 # ============== ACTIVITY LOG ==============
 
-async def log_activity(action: str, details: str, card_id: Optional[str] = None, status: str = "success"):
-    """Helper function to log activities"""
+# Log writes are queued and flushed in batches off the request path
+LOG_QUEUE_SIZE = 10000
+LOG_BATCH_SIZE = 500
+LOG_FLUSH_INTERVAL = 0.2
+
+# Created at startup so the queue belongs to the server's event loop
+log_queue: Optional[asyncio.Queue] = None
+_log_flusher_task: Optional[asyncio.Task] = None
+_LOG_STOP = object()
+# Bumped by clear_activity_logs; each queued entry carries the value it was logged
+# under, so the flusher can drop entries that predate a clear
+_log_clears = 0
+
+def log_activity(action: str, details: str, card_id: Optional[str] = None, status: str = "success"):
+    """Helper function to log activities without holding up the response"""
     log = ActivityLog(action=action, details=details, card_id=card_id, status=status)
-    doc = log.model_dump()
-    doc['timestamp'] = doc['timestamp'].isoformat()
-    await db.activity_logs.insert_one(doc)
+    if log_queue is None:
+        # Startup hasn't run (e.g. TestClient without its lifespan), so nothing would write it
+        return log
+    try:
+        log_queue.put_nowait((_log_clears, log.model_dump()))
+    except asyncio.QueueFull:
+        logger.warning(f"Activity log queue full, dropping {action} entry")
     return log
 
+async def log_flusher():
+    """Write queued activity logs with insert_many until the stop marker arrives"""
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await log_queue.get()
+        batch = []
+        deadline = loop.time() + LOG_FLUSH_INTERVAL
+        while item is not _LOG_STOP:
+            batch.append(item)
+            if len(batch) >= LOG_BATCH_SIZE:
+                break
+            try:
+                item = await asyncio.wait_for(log_queue.get(), deadline - loop.time())
+            except asyncio.TimeoutError:
+                break
+        
+        docs = [doc for clears, doc in batch if clears == _log_clears]
+        if docs:
+            try:
+                await activity_logs.insert_many(docs, ordered=False)
+            except Exception as e:
+                logger.error(f"Activity log write error: {e}")
+        
+        if item is _LOG_STOP:
+            return
+
 @api_router.get("/activity", response_model=List[ActivityLog])
-async def get_activity_logs(limit: int = 50, card_id: Optional[str] = None):
+async def get_activity_logs(limit: int = Query(50, ge=1), card_id: Optional[str] = None):
     """Get activity logs"""
     query = {"card_id": card_id} if card_id else {}
-    logs = await db.activity_logs.find(query, {"_id": 0}).sort("timestamp", -1).to_list(limit)
-    for log in logs:
-        if isinstance(log.get('timestamp'), str):
-            log['timestamp'] = datetime.fromisoformat(log['timestamp'])
-    return logs
+    cursor = db.activity_logs.find(query, ACTIVITY_LOG_PROJECTION).sort("timestamp", -1).limit(limit)
+    logs = await cursor.to_list(limit)
+    return ORJSONResponse(logs)
 
 @api_router.delete("/activity/clear")
 async def clear_activity_logs():
-    """Clear all activity logs"""
+    """Clear all activity logs, including entries still waiting to be written"""
+    global _log_clears
+    _log_clears += 1
     await db.activity_logs.delete_many({})
     return {"status": "cleared"}
 
@@ -927,17 +1320,52 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def startup_db_client():
+    global log_queue, _log_flusher_task
+    log_queue = asyncio.Queue(maxsize=LOG_QUEUE_SIZE)
+    _log_flusher_task = asyncio.create_task(log_flusher())
+    # The client connects lazily; ping so the pool is open before the first request
+    await client.admin.command("ping")
+    await run_migrations()
+    # Every endpoint looks documents up by id or card_id
+    await asyncio.gather(
+        db.cards.create_index("id", unique=True),
+        db.contacts.create_index("id", unique=True),
+        db.contacts.create_index("card_id"),
+        db.sms.create_index("id", unique=True),
+        db.sms.create_index([("card_id", 1), ("index", 1)]),
+        db.security_analysis.create_index("card_id"),
+        db.esim_profiles.create_index("id", unique=True),
+        db.esim_profiles.create_index("card_id"),
+        # Activity logs are listed newest first, optionally for a single card
+        db.activity_logs.create_index([("timestamp", -1)]),
+        db.activity_logs.create_index([("card_id", 1), ("timestamp", -1)])
+    )
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
+    # Drain queued activity logs while the client is still open
+    await log_queue.put(_LOG_STOP)
+    await _log_flusher_task
+    await client.close()
+    card_connections.close()
 
 # For standalone running
 if __name__ == "__main__":
     import uvicorn
+    # uvloop/httptools are drop-in faster loop and HTTP parser; not available on Windows
+    try:
+        import uvloop
+        import httptools
+        LOOP_IMPL, HTTP_IMPL = "uvloop", "httptools"
+    except ImportError:
+        LOOP_IMPL, HTTP_IMPL = "asyncio", "h11"
     print("\n" + "="*60)
     print("SimGuard Pro - Standalone SIM Card Security Tool")
     print("="*60)
     print(f"Hardware Mode: {'ENABLED' if HARDWARE_MODE else 'DISABLED (install pyscard)'}")
     print(f"QR Code Mode: {'ENABLED' if QR_MODE else 'DISABLED (install qrcode)'}")
+    print(f"Event Loop: {LOOP_IMPL} ({HTTP_IMPL})")
     print("="*60 + "\n")
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    uvicorn.run(app, host="0.0.0.0", port=8001, loop=LOOP_IMPL, http=HTTP_IMPL)
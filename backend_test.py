@@ -1,57 +1,235 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+import os
 import sys
-import json
-from datetime import datetime
+import orjson
+import argparse
+import threading
+import time
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+logger = logging.getLogger('simguard')
+logger.setLevel(logging.INFO)
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(logging.Formatter('%(message)s'))
+logger.addHandler(_handler)
+
+MAX_WORKERS = 8
+MAX_POOL_SIZE = 16
+# Contacts sent in one request by the bulk create and import tests
+BULK_CONTACT_COUNT = 25
+# Export bodies are drained in chunks of this size instead of being buffered
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Fixed parts of the POST bodies, encoded once; tests append the per-run card ID
+CONTACT_BODY = orjson.dumps({
+    "name": "Test Contact",
+    "number": "+15551234567",
+    "group": "Test",
+    "email": "test@example.com"
+})
+UPDATE_CONTACT_BODY = orjson.dumps({"name": "Updated Test Contact"})
+SMS_BODY = orjson.dumps({
+    "sender": "+15551234567",
+    "recipient": "+15559876543",
+    "message": "Test SMS message",
+    "status": "draft"
+})
+CLONE_BODY = orjson.dumps({"clone_contacts": True, "clone_sms": True, "clone_settings": True})
+ESIM_BODY = orjson.dumps({"profile_name": "Test eSIM", "carrier": "test-carrier"})
+BULK_CONTACTS = tuple(
+    MappingProxyType({"name": f"Bulk Contact {i}", "number": f"+1555200{i:04d}"})
+    for i in range(BULK_CONTACT_COUNT)
+)
+BULK_CONTACTS_BODY = orjson.dumps({"contacts": [dict(contact) for contact in BULK_CONTACTS]})
+IMPORT_BODY = orjson.dumps({
+    "data": {
+        "contacts": [
+            {"name": f"Import Test {i}", "number": f"+1555111{i:04d}"}
+            for i in range(BULK_CONTACT_COUNT)
+        ]
+    },
+    "data_type": "contacts"
+})
+
+def with_field(body, key, value):
+    """Add one field to a pre-encoded JSON object"""
+    return body[:-1] + b',"' + key.encode() + b'":' + orjson.dumps(value) + b'}'
+
+# Try to import requests-cache so reruns can answer card, activity and export GETs from a local cache
+CACHE_MODE = False
+try:
+    import requests_cache
+    CACHE_MODE = True
+except ImportError:
+    pass
+
+CACHE_NAME = os.path.join(os.path.expanduser('~'), '.cache', 'simguard_tests', 'simguard_cache')
+CACHE_EXPIRE_SECONDS = 60
+
+def depends_on(*attributes):
+    """Mark a test as needing IDs captured by earlier tests; main() skips it while any is unset"""
+    def decorate(test_func):
+        test_func.requires = attributes
+        return test_func
+    return decorate
 
 class SimGuardAPITester:
-    def __init__(self, base_url="https://ic-analyst.preview.emergentagent.com/api"):
+    def __init__(self, base_url="https://ic-analyst.preview.emergentagent.com/api", use_cache=True):
         self.base_url = base_url
         self.tests_run = 0
         self.tests_passed = 0
         self.test_card_id = None
         self.test_contact_id = None
+        self.test_contact_ids = None
         self.test_sms_id = None
         self.test_clone_id = None
+        # One keep-alive session so every test after the first skips the TCP/TLS handshake
+        self.cached = use_cache and CACHE_MODE
+        if self.cached:
+            os.makedirs(os.path.dirname(CACHE_NAME), exist_ok=True)
+            # Only data reads are cached; health and readers must always reach the server
+            api = base_url.split('://', 1)[-1]
+            self.session = requests_cache.CachedSession(
+                CACHE_NAME,
+                backend='sqlite',
+                expire_after=requests_cache.DO_NOT_CACHE,
+                urls_expire_after={
+                    f'{api}/cards': CACHE_EXPIRE_SECONDS,
+                    f'{api}/activity': CACHE_EXPIRE_SECONDS,
+                    f'{api}/export/': CACHE_EXPIRE_SECONDS,
+                },
+                allowable_methods=('GET',)
+            )
+        else:
+            self.session = requests.Session()
+        self.session.headers.update({'Content-Type': 'application/json'})
+        # Retry connection errors and gateway failures with backoff; a 500 is a real
+        # server error and is reported straight away. Read errors are not retried: the
+        # request may already have been processed, and resending a POST duplicates it
+        retry = Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_POOL_SIZE, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Tests within a stage run on worker threads
+        self.lock = threading.Lock()
+        # One record per request, rendered as a summary table after the run
+        self.results = deque()
+        # Set once the server refuses connections; later requests fail fast without a network call
+        self.abort = False
+        # Tests that returned early because of abort, reported as not run
+        self.not_run = deque()
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, params=None):
-        """Run a single API test"""
+    def run_test(self, name, method, endpoint, expected_status, data=None, params=None, stream=False, body=None, parse=True, optional_route=False):
+        """Run a single API test; body is an already-encoded JSON payload used instead of data"""
         url = f"{self.base_url}/{endpoint}"
-        headers = {'Content-Type': 'application/json'}
+        # expected_status may be one code or a collection of acceptable codes
+        expected = {expected_status} if isinstance(expected_status, int) else set(expected_status)
+        
+        if self.abort:
+            logger.info(f"\n⏭️  Not running {name} - server unreachable")
+            self.not_run.append(name)
+            return (False, {})
         
-        self.tests_run += 1
-        print(f"\n🔍 Testing {name}...")
-        print(f"   URL: {url}")
+        # Collect the report and log it in one go so concurrent tests don't interleave
+        lines = [f"\n🔍 Testing {name}...", f"   URL: {url}"]
+        result = (False, {})
+        status_code = None
+        started = time.perf_counter()
         
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=headers, params=params, timeout=10)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers, timeout=10)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=headers, timeout=10)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=headers, timeout=10)
-
-            success = response.status_code == expected_status
+            if body is not None:
+                response = self.session.request(method, url, data=body, params=params, timeout=10, stream=stream)
+            else:
+                response = self.session.request(method, url, json=data, params=params, timeout=10, stream=stream)
+            status_code = response.status_code
+
+            success = response.status_code in expected
             if success:
-                self.tests_passed += 1
-                print(f"✅ Passed - Status: {response.status_code}")
-                try:
-                    return True, response.json() if response.content else {}
-                except:
-                    return True, {}
+                lines.append(f"✅ Passed - Status: {response.status_code}")
+                if stream:
+                    # Only the status matters: read the body in chunks without keeping it,
+                    # which also leaves the connection reusable
+                    size = sum(len(chunk) for chunk in response.iter_content(STREAM_CHUNK_SIZE))
+                    response.close()
+                    lines.append(f"   Streamed {size} bytes")
+                    result = (True, {})
+                elif not parse:
+                    # The caller only checks the status, so don't decode the body
+                    result = (True, None)
+                else:
+                    try:
+                        result = (True, orjson.loads(response.content) if response.content else {})
+                    except ValueError:
+                        result = (True, {})
             else:
-                print(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
                 try:
-                    print(f"   Response: {response.text[:200]}...")
-                except:
+                    # Callers can inspect the error body, e.g. to tell a missing route from a missing record
+                    result = (False, orjson.loads(response.content))
+                except ValueError:
                     pass
+                if optional_route and response.status_code == 404 and isinstance(result[1], dict) and result[1].get("detail") == "Not Found":
+                    # The server predates this route; the caller falls back, so the request isn't counted
+                    logger.info(f"\n⚠️  {name} - {method} {endpoint} not available on this server")
+                    return result
+                lines.append(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
+                lines.append(f"   Response: {response.text[:200]}...")
 
-        except Exception as e:
-            print(f"❌ Failed - Error: {str(e)}")
-            return False, {}
+        except requests.exceptions.ConnectionError as e:
+            # Read timeouts and dropped responses arrive wrapped in ConnectionError too;
+            # only a failure to connect means the server is down
+            reason = getattr(e.args[0], "reason", None) if e.args else None
+            if isinstance(reason, (NewConnectionError, ConnectTimeoutError)):
+                self.abort = True
+                lines.append(f"❌ Failed - Server unreachable: {str(e)}")
+            else:
+                lines.append(f"❌ Failed - Error: {str(e)}")
+        except requests.exceptions.RequestException as e:
+            lines.append(f"❌ Failed - Error: {str(e)}")
+
+        self.results.append({
+            "name": name,
+            "method": method,
+            "status": status_code,
+            "passed": result[0],
+            "elapsed": time.perf_counter() - started
+        })
+        with self.lock:
+            self.tests_run += 1
+            if result[0]:
+                self.tests_passed += 1
+        logger.info("\n".join(lines))
+        return result
+
+    def warmup(self, executor, connections):
+        """Open pooled connections concurrently so the first stage doesn't pay for the handshakes"""
+        url = f"{self.base_url}/health"
+        
+        def ping(_):
+            try:
+                self.session.get(url, timeout=5)
+            except requests.exceptions.RequestException:
+                pass
+        
+        list(executor.map(ping, range(connections)))
 
-        return success, {}
+    def invalidate(self, endpoint, params=None):
+        """Drop a cached GET response that a write has made stale"""
+        if self.cached:
+            url = requests.Request('GET', f"{self.base_url}/{endpoint}", params=params).prepare().url
+            self.session.cache.delete(urls=[url])
 
     def test_health_check(self):
         """Test basic health endpoint"""
@@ -61,13 +239,13 @@ class SimGuardAPITester:
         """Test PC/SC readers endpoint"""
         success, response = self.run_test("Get Readers", "GET", "readers", 200)
         if success and isinstance(response, list) and len(response) > 0:
-            print(f"   Found {len(response)} readers")
+            logger.info(f"   Found {len(response)} readers")
             return True
         return success
 
     def test_reader_connect(self):
         """Test connecting to a reader"""
-        return self.run_test("Connect Reader", "POST", "readers/reader-001/connect", 200)
+        return self.run_test("Connect Reader", "POST", "readers/reader-001/connect", 200, parse=False)
 
     def test_card_read(self):
         """Test reading a card"""
@@ -77,78 +255,86 @@ class SimGuardAPITester:
             "cards/read?reader_id=reader-001", 
             200
         )
+        self.invalidate("cards")
+        self.invalidate("cards/summary")
         if success and "id" in response:
             self.test_card_id = response["id"]
-            print(f"   Card ID: {self.test_card_id}")
+            logger.info(f"   Card ID: {self.test_card_id}")
         return success
 
     def test_get_cards(self):
         """Test getting all cards"""
         success, response = self.run_test("Get Cards", "GET", "cards", 200)
         if success and isinstance(response, list):
-            print(f"   Found {len(response)} cards")
+            logger.info(f"   Found {len(response)} cards")
         return success
 
+    @depends_on('test_card_id')
     def test_get_card_detail(self):
         """Test getting specific card details"""
-        if not self.test_card_id:
-            print("⚠️  Skipping card detail test - no card ID available")
-            return True
         return self.run_test("Get Card Detail", "GET", f"cards/{self.test_card_id}", 200)
 
+    @depends_on('test_card_id')
     def test_create_contact(self):
         """Test creating a contact"""
-        if not self.test_card_id:
-            print("⚠️  Skipping contact creation - no card ID available")
-            return True
-            
-        contact_data = {
-            "card_id": self.test_card_id,
-            "name": "Test Contact",
-            "number": "+15551234567",
-            "group": "Test",
-            "email": "test@example.com"
-        }
-        success, response = self.run_test("Create Contact", "POST", "contacts", 200, contact_data)
+        contact_body = with_field(CONTACT_BODY, "card_id", self.test_card_id)
+        success, response = self.run_test("Create Contact", "POST", "contacts", 200, body=contact_body)
         if success and "id" in response:
             self.test_contact_id = response["id"]
-            print(f"   Contact ID: {self.test_contact_id}")
+            logger.info(f"   Contact ID: {self.test_contact_id}")
         return success
 
+    @depends_on('test_card_id')
+    def test_bulk_create_contacts(self):
+        """Test creating many contacts in one request"""
+        bulk_body = with_field(BULK_CONTACTS_BODY, "card_id", self.test_card_id)
+        success, response = self.run_test("Bulk Create Contacts", "POST", "contacts/bulk", 200, body=bulk_body, optional_route=True)
+        if not success and isinstance(response, dict) and response.get("detail") == "Not Found":
+            # Servers without the bulk route get one POST per contact instead
+            logger.info("⚠️  Falling back to per-contact creation")
+            response = []
+            for contact in BULK_CONTACTS:
+                created, contact_response = self.run_test(
+                    f"Create Contact {contact['name']}", "POST", "contacts", 200,
+                    {"card_id": self.test_card_id, **contact}
+                )
+                if created:
+                    response.append(contact_response)
+            success = len(response) == len(BULK_CONTACTS)
+        if isinstance(response, list):
+            self.test_contact_ids = [contact["id"] for contact in response if "id" in contact]
+            logger.info(f"   Created {len(self.test_contact_ids)} contacts")
+        return success
+
+    @depends_on('test_contact_ids')
+    def test_delete_bulk_contacts(self):
+        """Test deleting the bulk-created contacts"""
+        return all([
+            self.run_test(f"Delete Contact {contact_id}", "DELETE", f"contacts/{contact_id}", 200, parse=False)[0]
+            for contact_id in self.test_contact_ids
+        ])
+
     def test_get_contacts(self):
         """Test getting contacts"""
         params = {"card_id": self.test_card_id} if self.test_card_id else {}
         success, response = self.run_test("Get Contacts", "GET", "contacts", 200, params=params)
         if success and isinstance(response, list):
-            print(f"   Found {len(response)} contacts")
+            logger.info(f"   Found {len(response)} contacts")
         return success
 
+    @depends_on('test_contact_id')
     def test_update_contact(self):
         """Test updating a contact"""
-        if not self.test_contact_id:
-            print("⚠️  Skipping contact update - no contact ID available")
-            return True
-            
-        update_data = {"name": "Updated Test Contact"}
-        return self.run_test("Update Contact", "PUT", f"contacts/{self.test_contact_id}", 200, update_data)
+        return self.run_test("Update Contact", "PUT", f"contacts/{self.test_contact_id}", 200, body=UPDATE_CONTACT_BODY, parse=False)
 
+    @depends_on('test_card_id')
     def test_create_sms(self):
         """Test creating an SMS"""
-        if not self.test_card_id:
-            print("⚠️  Skipping SMS creation - no card ID available")
-            return True
-            
-        sms_data = {
-            "card_id": self.test_card_id,
-            "sender": "+15551234567",
-            "recipient": "+15559876543",
-            "message": "Test SMS message",
-            "status": "draft"
-        }
-        success, response = self.run_test("Create SMS", "POST", "sms", 200, sms_data)
+        sms_body = with_field(SMS_BODY, "card_id", self.test_card_id)
+        success, response = self.run_test("Create SMS", "POST", "sms", 200, body=sms_body)
         if success and "id" in response:
             self.test_sms_id = response["id"]
-            print(f"   SMS ID: {self.test_sms_id}")
+            logger.info(f"   SMS ID: {self.test_sms_id}")
         return success
 
     def test_get_sms(self):
@@ -156,149 +342,174 @@ class SimGuardAPITester:
         params = {"card_id": self.test_card_id} if self.test_card_id else {}
         success, response = self.run_test("Get SMS", "GET", "sms", 200, params=params)
         if success and isinstance(response, list):
-            print(f"   Found {len(response)} SMS messages")
+            logger.info(f"   Found {len(response)} SMS messages")
         return success
 
+    @depends_on('test_card_id')
     def test_clone_card(self):
         """Test cloning a card"""
-        if not self.test_card_id:
-            print("⚠️  Skipping card clone - no card ID available")
-            return True
-            
-        clone_data = {
-            "source_card_id": self.test_card_id,
-            "clone_contacts": True,
-            "clone_sms": True,
-            "clone_settings": True
-        }
-        success, response = self.run_test("Clone Card", "POST", "clone", 200, clone_data)
+        clone_body = with_field(CLONE_BODY, "source_card_id", self.test_card_id)
+        success, response = self.run_test("Clone Card", "POST", "clone", 200, body=clone_body)
         if success and "cloned_card_id" in response:
             self.test_clone_id = response["cloned_card_id"]
-            print(f"   Cloned Card ID: {self.test_clone_id}")
+            logger.info(f"   Cloned Card ID: {self.test_clone_id}")
         return success
 
+    @depends_on('test_card_id')
     def test_security_analysis(self):
         """Test security analysis"""
-        if not self.test_card_id:
-            print("⚠️  Skipping security analysis - no card ID available")
-            return True
         return self.run_test("Security Analysis", "POST", f"analyze/{self.test_card_id}", 200)
 
+    @depends_on('test_card_id')
     def test_esim_convert(self):
         """Test eSIM conversion"""
-        if not self.test_card_id:
-            print("⚠️  Skipping eSIM conversion - no card ID available")
-            return True
-            
-        esim_data = {
-            "card_id": self.test_card_id,
-            "profile_name": "Test eSIM",
-            "carrier": "test-carrier"
-        }
-        return self.run_test("eSIM Convert", "POST", "esim/convert", 200, esim_data)
+        esim_body = with_field(ESIM_BODY, "card_id", self.test_card_id)
+        return self.run_test("eSIM Convert", "POST", "esim/convert", 200, body=esim_body)
 
+    @depends_on('test_card_id')
     def test_export_json(self):
         """Test JSON export"""
-        if not self.test_card_id:
-            print("⚠️  Skipping JSON export - no card ID available")
-            return True
-        return self.run_test("Export JSON", "GET", f"export/{self.test_card_id}", 200, params={"format": "json"})
+        return self.run_test("Export JSON", "GET", f"export/{self.test_card_id}", 200, params={"format": "json"}, stream=True)
 
+    @depends_on('test_card_id')
     def test_export_csv(self):
         """Test CSV export"""
-        if not self.test_card_id:
-            print("⚠️  Skipping CSV export - no card ID available")
-            return True
-        return self.run_test("Export CSV", "GET", f"export/{self.test_card_id}", 200, params={"format": "csv"})
+        return self.run_test("Export CSV", "GET", f"export/{self.test_card_id}", 200, params={"format": "csv"}, stream=True)
 
+    @depends_on('test_card_id')
     def test_import_data(self):
         """Test data import"""
-        if not self.test_card_id:
-            print("⚠️  Skipping data import - no card ID available")
-            return True
-            
-        import_data = {
-            "card_id": self.test_card_id,
-            "data": {
-                "contacts": [
-                    {"name": "Import Test", "number": "+15551111111"}
-                ]
-            },
-            "data_type": "contacts"
-        }
-        return self.run_test("Import Data", "POST", "import", 200, import_data)
+        import_body = with_field(IMPORT_BODY, "card_id", self.test_card_id)
+        success, response = self.run_test("Import Data", "POST", "import", 200, body=import_body)
+        if success:
+            logger.info(f"   Imported {response.get('contacts_imported', 0)} contacts in one request")
+        return success
 
     def test_activity_logs(self):
         """Test activity logs"""
         return self.run_test("Get Activity Logs", "GET", "activity", 200, params={"limit": 10})
 
+    @depends_on('test_contact_id')
     def test_delete_contact(self):
         """Test deleting a contact"""
-        if not self.test_contact_id:
-            print("⚠️  Skipping contact deletion - no contact ID available")
-            return True
-        return self.run_test("Delete Contact", "DELETE", f"contacts/{self.test_contact_id}", 200)
+        return self.run_test("Delete Contact", "DELETE", f"contacts/{self.test_contact_id}", 200, parse=False)
 
+    @depends_on('test_sms_id')
     def test_delete_sms(self):
         """Test deleting an SMS"""
-        if not self.test_sms_id:
-            print("⚠️  Skipping SMS deletion - no SMS ID available")
-            return True
-        return self.run_test("Delete SMS", "DELETE", f"sms/{self.test_sms_id}", 200)
+        return self.run_test("Delete SMS", "DELETE", f"sms/{self.test_sms_id}", 200, parse=False)
 
+    @depends_on('test_card_id')
     def test_delete_card(self):
         """Test deleting a card"""
-        if not self.test_card_id:
-            print("⚠️  Skipping card deletion - no card ID available")
-            return True
         # Delete cloned card first if it exists
         if self.test_clone_id:
-            self.run_test("Delete Cloned Card", "DELETE", f"cards/{self.test_clone_id}", 200)
-        return self.run_test("Delete Card", "DELETE", f"cards/{self.test_card_id}", 200)
+            self.run_test("Delete Cloned Card", "DELETE", f"cards/{self.test_clone_id}", 200, parse=False)
+        return self.run_test("Delete Card", "DELETE", f"cards/{self.test_card_id}", 200, parse=False)
 
 def main():
+    parser = argparse.ArgumentParser(description="SimGuard Pro API tests")
+    parser.add_argument("--no-cache", action="store_true", help="clear cached card, activity and export responses and query the server for every test")
+    args = parser.parse_args()
+    
     print("🚀 Starting SimGuard Pro API Tests")
     print("=" * 50)
     
-    tester = SimGuardAPITester()
-
-    # Core API tests in logical order
-    test_sequence = [
-        ("Health Check", tester.test_health_check),
-        ("PC/SC Readers", tester.test_readers),
-        ("Reader Connect", tester.test_reader_connect),
-        ("Card Read", tester.test_card_read),
-        ("Get Cards", tester.test_get_cards),
-        ("Get Card Detail", tester.test_get_card_detail),
-        ("Create Contact", tester.test_create_contact),
-        ("Get Contacts", tester.test_get_contacts),
-        ("Update Contact", tester.test_update_contact),
-        ("Create SMS", tester.test_create_sms),
-        ("Get SMS", tester.test_get_sms),
-        ("Clone Card", tester.test_clone_card),
-        ("Security Analysis", tester.test_security_analysis),
-        ("eSIM Convert", tester.test_esim_convert),
-        ("Export JSON", tester.test_export_json),
-        ("Export CSV", tester.test_export_csv),
-        ("Import Data", tester.test_import_data),
-        ("Activity Logs", tester.test_activity_logs),
-        ("Delete Contact", tester.test_delete_contact),
-        ("Delete SMS", tester.test_delete_sms),
-        ("Delete Card", tester.test_delete_card),
+    if args.no_cache and CACHE_MODE:
+        os.makedirs(os.path.dirname(CACHE_NAME), exist_ok=True)
+        requests_cache.CachedSession(CACHE_NAME, backend='sqlite').cache.clear()
+    tester = SimGuardAPITester(use_cache=not args.no_cache)
+    print(f"GET cache: {'ENABLED' if tester.cached else 'DISABLED'}")
+
+    # Tests grouped into stages; tests within a stage are independent of each other
+    test_stages = [
+        [
+            ("Health Check", tester.test_health_check, True),
+            ("PC/SC Readers", tester.test_readers, False),
+            ("Reader Connect", tester.test_reader_connect, True),
+            ("Activity Logs", tester.test_activity_logs, False),
+        ],
+        [
+            ("Card Read", tester.test_card_read, False),
+        ],
+        [
+            ("Get Cards", tester.test_get_cards, False),
+            ("Get Card Detail", tester.test_get_card_detail, False),
+            ("Create Contact", tester.test_create_contact, False),
+            ("Bulk Create Contacts", tester.test_bulk_create_contacts, False),
+            ("Create SMS", tester.test_create_sms, False),
+        ],
+        [
+            ("Get Contacts", tester.test_get_contacts, False),
+            ("Update Contact", tester.test_update_contact, False),
+            ("Get SMS", tester.test_get_sms, False),
+            ("Clone Card", tester.test_clone_card, False),
+            ("Security Analysis", tester.test_security_analysis, False),
+            ("eSIM Convert", tester.test_esim_convert, False),
+            ("Export JSON", tester.test_export_json, False),
+            ("Export CSV", tester.test_export_csv, False),
+            ("Import Data", tester.test_import_data, False),
+        ],
+        [
+            ("Delete Contact", tester.test_delete_contact, False),
+            ("Delete Bulk Contacts", tester.test_delete_bulk_contacts, False),
+            ("Delete SMS", tester.test_delete_sms, False),
+        ],
+        [
+            ("Delete Card", tester.test_delete_card, False),
+        ],
     ]
 
-    # Run all tests
-    for test_name, test_func in test_sequence:
+    def run_named_test(named_test):
+        test_name, test_func, _ = named_test
         try:
-            test_func()
+            result = test_func()
+            return result[0] if isinstance(result, tuple) else bool(result)
         except Exception as e:
-            print(f"❌ {test_name} failed with exception: {str(e)}")
+            logger.error(f"❌ {test_name} failed with exception: {str(e)}")
+            return False
+
+    # Run each stage concurrently, stages in order
+    not_run = []
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        tester.warmup(executor, MAX_WORKERS)
+        for position, stage in enumerate(test_stages):
+            # Dependencies are checked once per stage, after the stages that set them
+            runnable, skipped = [], []
+            for named_test in stage:
+                requires = getattr(named_test[1], "requires", ())
+                missing = [r for r in requires if getattr(tester, r) is None]
+                if missing:
+                    skipped.append(f"{named_test[0]} (no {', '.join(missing)})")
+                else:
+                    runnable.append(named_test)
+            if skipped:
+                logger.info(f"⚠️  Skipping {len(skipped)} tests: {'; '.join(skipped)}")
+            outcomes = list(executor.map(run_named_test, runnable))
+            
+            failed_critical = [named_test[0] for named_test, passed in zip(runnable, outcomes) if named_test[2] and not passed]
+            if failed_critical or tester.abort:
+                reason = "server unreachable" if tester.abort else f"critical test failed: {', '.join(failed_critical)}"
+                not_run = list(tester.not_run) + [named_test[0] for later_stage in test_stages[position + 1:] for named_test in later_stage]
+                logger.error(f"🛑 Stopping early ({reason}) - {len(not_run)} tests not run")
+                break
+    
+    tester.session.close()
 
     # Print results
     print("\n" + "=" * 50)
+    for record in tester.results:
+        print(
+            f"{'✅' if record['passed'] else '❌'} {record['name']:<40} {record['method']:<6} "
+            f"{record['status'] or '---'}  {record['elapsed'] * 1000:7.1f} ms"
+        )
+    print("=" * 50)
     print(f"📊 Test Results: {tester.tests_passed}/{tester.tests_run} passed")
     
-    if tester.tests_passed == tester.tests_run:
+    if not_run:
+        print(f"⏭️  {len(not_run)} tests not run: {', '.join(not_run)}")
+    
+    if tester.tests_passed == tester.tests_run and not not_run:
         print("🎉 All tests passed!")
         return 0
     else:
@@ -55,7 +55,7 @@ export default function CloneTool() {
 
   const fetchCards = async () => {
     try {
-      const response = await axios.get(`${API}/cards`);
+      const response = await axios.get(`${API}/cards/summary`);
       setCards(response.data);
     } catch (error) {
       console.error("Failed to fetch cards:", error);
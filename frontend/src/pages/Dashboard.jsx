@@ -34,7 +34,7 @@ export default function Dashboard() {
     setLoading(true);
     try {
       const [cardsRes, contactsRes, smsRes, activityRes] = await Promise.all([
-        axios.get(`${API}/cards`),
+        axios.get(`${API}/cards/summary`),
         axios.get(`${API}/contacts`),
         axios.get(`${API}/sms`),
         axios.get(`${API}/activity?limit=5`)
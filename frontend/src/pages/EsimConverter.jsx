@@ -50,7 +50,7 @@ export default function EsimConverter() {
 
   const fetchCards = async () => {
     try {
-      const response = await axios.get(`${API}/cards`);
+      const response = await axios.get(`${API}/cards/summary`);
       setCards(response.data);
       if (response.data.length > 0) {
         setSelectedCard(response.data[0].id);
@@ -70,7 +70,7 @@ export default function SMSManager() {
 
   const fetchCards = async () => {
     try {
-      const response = await axios.get(`${API}/cards`);
+      const response = await axios.get(`${API}/cards/summary`);
       setCards(response.data);
       if (response.data.length > 0) {
         setSelectedCard(response.data[0].id);
@@ -0,0 +1,160 @@
+"""Offline tests for server.py helpers that need no database or card reader
+
+They import backend/server.py, so they are skipped when its dependencies are not installed.
+"""
+import asyncio
+import csv
+import io
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+server = pytest.importorskip("server")
+
+FIELDS = ("id", "name", "number", "notes")
+
+CSV_VALUES = [
+    "plain",
+    "has,comma",
+    'has "quotes"',
+    "multi\nline",
+    '"quoted", and\nsplit',
+    None,
+    "",
+    42,
+]
+
+def csv_writer_line(values):
+    """Format one row the way the csv module does"""
+    out = io.StringIO()
+    csv.writer(out, lineterminator="\n").writerow(values)
+    return out.getvalue()
+
+def legacy_decode_bcd(data):
+    """The per-byte loop _decode_bcd replaced"""
+    iccid = ""
+    for byte in data:
+        iccid += str(byte & 0x0F)
+        if (byte >> 4) != 0x0F:
+            iccid += str(byte >> 4)
+    return iccid
+
+@pytest.mark.parametrize("value", CSV_VALUES)
+def test_csv_row_matches_csv_writer(value):
+    format_row = server._compile_csv_row(FIELDS)
+    doc = {"id": "c1", "name": value, "number": "+15551234", "notes": value}
+    assert format_row(doc) == csv_writer_line([doc[f] for f in FIELDS])
+
+def test_csv_row_missing_field_is_empty():
+    format_row = server._compile_csv_row(FIELDS)
+    assert format_row({"id": "c1"}) == csv_writer_line(["c1", None, None, None])
+
+def test_csv_row_quotes_carriage_return():
+    # csv.writer only quotes "\r" when it is part of the line terminator; the
+    # formatter always quotes it so spreadsheets do not split the row
+    format_row = server._compile_csv_row(FIELDS)
+    line = format_row({"id": "c1", "name": "a\rb", "number": "x", "notes": 'say "hi"\r\n'})
+    assert line == 'c1,"a\rb",x,"say ""hi""\r\n"\n'
+    assert next(csv.reader(io.StringIO(line, newline=""))) == ["c1", "a\rb", "x", 'say "hi"\r\n']
+
+def test_csv_row_formats_datetime_as_iso():
+    format_row = server._compile_csv_row(("id", "created_at"))
+    created = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    assert format_row({"id": "c1", "created_at": created}) == f"c1,{created.isoformat()}\n"
+
+def test_card_contact_sms_formatters_match_csv_writer():
+    for format_row, fields in (
+        (server._format_card_row, server.CARD_CSV_FIELDS),
+        (server._format_contact_row, server.CONTACT_CSV_FIELDS),
+        (server._format_sms_row, server.SMS_CSV_FIELDS),
+    ):
+        doc = {f: CSV_VALUES[i % len(CSV_VALUES)] for i, f in enumerate(fields)}
+        assert format_row(doc) == csv_writer_line([doc[f] for f in fields])
+
+@pytest.mark.parametrize("data", [
+    bytes.fromhex("981032547698103254f6"),  # 19-digit ICCID with filler
+    bytes.fromhex("98103254769810325476"),  # 20-digit ICCID
+    bytes.fromhex("00"),
+    bytes.fromhex("99"),
+    bytes.fromhex("f1"),
+    bytes(range(0x00, 0x0A)),
+    [0x21, 0x43, 0xf5],
+])
+def test_decode_bcd_matches_loop_decoder(data):
+    assert server._decode_bcd(data) == legacy_decode_bcd(data)
+
+def test_decode_bcd_all_valid_bytes():
+    valid = [hi << 4 | lo for hi in (*range(10), 0x0F) for lo in range(10)]
+    assert server._decode_bcd(valid) == legacy_decode_bcd(valid)
+    for byte in valid:
+        assert server._decode_bcd([byte]) == legacy_decode_bcd([byte])
+
+class FakeCollection:
+    """Records insert_many batches in place of the activity_logs collection"""
+    def __init__(self):
+        self.batches = []
+
+    async def insert_many(self, docs, ordered=True):
+        self.batches.append(list(docs))
+
+    async def delete_many(self, query):
+        self.batches.clear()
+
+    def details(self):
+        return [doc["details"] for batch in self.batches for doc in batch]
+
+@pytest.fixture
+def log_store(monkeypatch):
+    store = FakeCollection()
+    monkeypatch.setattr(server, "activity_logs", store)
+    monkeypatch.setattr(server, "db", SimpleNamespace(activity_logs=store))
+    monkeypatch.setattr(server, "log_queue", None)
+    monkeypatch.setattr(server, "LOG_FLUSH_INTERVAL", 0.05)
+    return store
+
+def run_logging(scenario):
+    """Run scenario against a fresh queue drained by log_flusher, then stop the flusher"""
+    async def main():
+        server.log_queue = asyncio.Queue(maxsize=server.LOG_QUEUE_SIZE)
+        flusher = asyncio.create_task(server.log_flusher())
+        await scenario()
+        await server.log_queue.put(server._LOG_STOP)
+        await flusher
+    asyncio.run(main())
+
+def test_log_flusher_batches_entries(log_store, monkeypatch):
+    monkeypatch.setattr(server, "LOG_BATCH_SIZE", 3)
+    async def scenario():
+        for i in range(7):
+            server.log_activity("TEST", f"entry {i}")
+        await asyncio.sleep(0.2)
+    run_logging(scenario)
+    assert [len(batch) for batch in log_store.batches] == [3, 3, 1]
+    assert log_store.details() == [f"entry {i}" for i in range(7)]
+
+def test_log_flusher_writes_queued_entries_on_stop(log_store):
+    async def scenario():
+        for i in range(5):
+            server.log_activity("TEST", f"entry {i}")
+    run_logging(scenario)
+    assert log_store.details() == [f"entry {i}" for i in range(5)]
+
+def test_clear_drops_entries_logged_before_it(log_store):
+    async def scenario():
+        server.log_activity("TEST", "before 1")
+        server.log_activity("TEST", "before 2")
+        # Let the flusher take these into its batch before the clear
+        await asyncio.sleep(0)
+        server.log_activity("TEST", "still queued")
+        await server.clear_activity_logs()
+        server.log_activity("TEST", "after")
+    run_logging(scenario)
+    assert log_store.details() == ["after"]
+
+def test_log_activity_before_startup(log_store):
+    log = server.log_activity("TEST", "no queue yet")
+    assert log.details == "no queue yet"